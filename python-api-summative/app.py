@@ -3,7 +3,11 @@ Flask REST API for Inventory Management System
 Provides CRUD operations for managing inventory items.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from inventory_store import MemoryStore
+from rate_limit import AdmissionController, RateLimiter, queue_latency, retry_after
 
 app = Flask(__name__)
 
@@ -39,30 +43,90 @@ inventory = [
     }
 ]
 
-# Counter for generating unique IDs
-next_id = 4
+# Backing store for the routes; serve.py swaps in a SQLiteStore so several
+# worker processes can share one inventory
+store = MemoryStore(inventory)
+
+# Each client may call each route RATE_LIMIT times per second, bursting to RATE_BURST
+RATE_LIMIT = 20
+RATE_BURST = 40
+
+# Shed load once this many requests are running or a request queued this long (seconds)
+MAX_IN_FLIGHT = 64
+MAX_QUEUE_LATENCY = 2.0
+
+# Set limiter to None to turn rate limiting off (serve.py --no-rate-limit)
+limiter = RateLimiter(RATE_LIMIT, RATE_BURST)
+admission = AdmissionController(MAX_IN_FLIGHT, MAX_QUEUE_LATENCY)
+
+
+def trust_proxies(count):
+    """
+    Identify clients by X-Forwarded-For instead of the connecting address.
+
+    Only enable this behind reverse proxies that set the header; otherwise
+    clients can pick their own rate limit key.
+
+    Args:
+        count: Number of trusted proxies in front of the app
+    """
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=count)
+
+
+@app.before_request
+def admit_request():
+    """Apply per-client rate limits, then admission control."""
+    # Keep the stats endpoint reachable so the limiter can be watched under load
+    if request.endpoint == 'get_limits':
+        return None
+
+    # remote_addr is the real client once trust_proxies() has been applied
+    wait = limiter.check((request.remote_addr, request.endpoint)) if limiter else 0
+    if wait:
+        response = jsonify({"status": 0, "error": "Rate limit exceeded"})
+        response.headers['Retry-After'] = retry_after(wait)
+        return response, 429
+
+    if not admission.enter(queue_latency(request.headers.get('X-Request-Start'))):
+        response = jsonify({"status": 0, "error": "Server busy"})
+        response.headers['Retry-After'] = retry_after(1)
+        return response, 503
+    g.admitted = True
+    return None
+
+
+@app.teardown_request
+def release_request(exc):
+    """Free the admission slot taken by this request."""
+    if g.pop('admitted', False):
+        admission.leave()
+
+
+@app.route('/limits', methods=['GET'])
+def get_limits():
+    """Report rate limiter and admission control state."""
+    return jsonify({"status": 1, "rate_limiter": limiter.stats() if limiter else None,
+                    "admission": admission.stats()})
 
 
 @app.route('/inventory', methods=['GET'])
 def get_all_items():
     """Fetch all inventory items."""
-    return jsonify({"status": 1, "items": inventory})
+    return jsonify({"status": 1, "items": store.all_items()})
 
 
 @app.route('/inventory/<int:item_id>', methods=['GET'])
 def get_item(item_id):
     """Fetch a single inventory item by ID."""
-    for item in inventory:
-        if item['id'] == item_id:
-            return jsonify({"status": 1, "product": item})
+    item = store.get_item(item_id)
+    if item is not None:
+        return jsonify({"status": 1, "product": item})
     return jsonify({"status": 0, "error": "Item not found"}), 404
 
 
 @app.route('/inventory', methods=['POST'])
 def add_item():
     """Add a new inventory item."""
-    global next_id
-
     data = request.get_json()
 
     # Validate required fields
@@ -70,18 +134,7 @@ def add_item():
         return jsonify({"status": 0, "error": "Product name is required"}), 400
 
     # Create new item with auto-generated ID
-    new_item = {
-        "id": next_id,
-        "barcode": data.get('barcode', ''),
-        "product_name": data.get('product_name', ''),
-        "brands": data.get('brands', ''),
-        "ingredients_text": data.get('ingredients_text', ''),
-        "quantity": data.get('quantity', 0),
-        "price": data.get('price', 0.0)
-    }
-
-    inventory.append(new_item)
-    next_id += 1
+    new_item = store.add_item(data)
 
     return jsonify({"status": 1, "product": new_item}), 201
 
@@ -94,23 +147,10 @@ def update_item(item_id):
     if not data or len(data) == 0:
         return jsonify({"status": 0, "error": "No data provided"}), 400
 
-    for item in inventory:
-        if item['id'] == item_id:
-            # Update only the fields that are provided
-            if 'product_name' in data:
-                item['product_name'] = data['product_name']
-            if 'brands' in data:
-                item['brands'] = data['brands']
-            if 'barcode' in data:
-                item['barcode'] = data['barcode']
-            if 'ingredients_text' in data:
-                item['ingredients_text'] = data['ingredients_text']
-            if 'quantity' in data:
-                item['quantity'] = data['quantity']
-            if 'price' in data:
-                item['price'] = data['price']
-
-            return jsonify({"status": 1, "product": item})
+    # Update only the fields that are provided
+    item = store.update_item(item_id, data)
+    if item is not None:
+        return jsonify({"status": 1, "product": item})
 
     return jsonify({"status": 0, "error": "Item not found"}), 404
 
@@ -118,10 +158,9 @@ def update_item(item_id):
 @app.route('/inventory/<int:item_id>', methods=['DELETE'])
 def delete_item(item_id):
     """Remove an inventory item."""
-    for i, item in enumerate(inventory):
-        if item['id'] == item_id:
-            deleted_item = inventory.pop(i)
-            return jsonify({"status": 1, "message": "Item deleted", "product": deleted_item})
+    deleted_item = store.delete_item(item_id)
+    if deleted_item is not None:
+        return jsonify({"status": 1, "message": "Item deleted", "product": deleted_item})
 
     return jsonify({"status": 0, "error": "Item not found"}), 404
 
@@ -0,0 +1,182 @@
+"""
+ASGI Variant of the Inventory API
+Serves the same endpoints as app.py, with the same status codes and the same
+JSON for successful and validation responses, without tying up a thread per
+connection. Where Flask answers with an HTML error page (404, 405, 415, 400
+for bad JSON, 500), this answers the same status with a JSON error body.
+Run it under any ASGI server, e.g.:
+
+    uvicorn asgi_app:app --port 5000
+"""
+
+import asyncio
+import json
+import logging
+import re
+
+import app as inventory_app
+from inventory_store import MemoryStore
+
+logger = logging.getLogger(__name__)
+
+# Matches /inventory and /inventory/<id>
+ROUTE = re.compile(r'^/inventory(?:/(\d+))?$')
+
+
+async def call_store(method_name, *args):
+    """Call a store method, moving blocking stores off the event loop."""
+    store = inventory_app.store
+    method = getattr(store, method_name)
+    # MemoryStore never blocks; anything backed by I/O runs in a worker thread
+    if isinstance(store, MemoryStore):
+        return method(*args)
+    return await asyncio.to_thread(method, *args)
+
+
+class RequestError(Exception):
+    """A request that can't be handled, with the status code Flask would answer."""
+
+    def __init__(self, status, error):
+        super().__init__(error)
+        self.status = status
+        self.error = error
+
+
+def is_json(scope):
+    """Return True if the request declares a JSON body, using Flask's rule."""
+    content_type = dict(scope.get('headers', [])).get(b'content-type', b'').decode('latin-1')
+    mimetype = content_type.split(';')[0].strip().lower()
+    return mimetype == 'application/json' or (
+        mimetype.startswith('application/') and mimetype.endswith('+json'))
+
+
+async def read_json(scope, receive):
+    """Read the full request body and decode it as JSON, like Flask's get_json()."""
+    if not is_json(scope):
+        raise RequestError(415, "Content-Type must be application/json")
+
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise RequestError(400, "Invalid JSON")
+
+
+async def send_json(send, payload, status=200, headers=(), head=False):
+    """Send a JSON response encoded the same way Flask's jsonify does."""
+    if payload is None:
+        body = b''
+        content_headers = [(b'content-length', b'0')]
+    else:
+        body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode() + b'\n'
+        content_headers = [(b'content-type', b'application/json'),
+                           (b'content-length', str(len(body)).encode())]
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [*content_headers, *headers]
+    })
+    # HEAD responses keep the GET headers, including Content-Length, but no body
+    await send({"type": "http.response.body", "body": b'' if head else body})
+
+
+async def get_all_items():
+    """Fetch all inventory items."""
+    return {"status": 1, "items": await call_store('all_items')}, 200
+
+
+async def get_item(item_id):
+    """Fetch a single inventory item by ID."""
+    item = await call_store('get_item', item_id)
+    if item is not None:
+        return {"status": 1, "product": item}, 200
+    return {"status": 0, "error": "Item not found"}, 404
+
+
+async def add_item(data):
+    """Add a new inventory item."""
+    # Validate required fields
+    if not data or 'product_name' not in data:
+        return {"status": 0, "error": "Product name is required"}, 400
+
+    new_item = await call_store('add_item', data)
+    return {"status": 1, "product": new_item}, 201
+
+
+async def update_item(item_id, data):
+    """Update an existing inventory item."""
+    if not data or len(data) == 0:
+        return {"status": 0, "error": "No data provided"}, 400
+
+    item = await call_store('update_item', item_id, data)
+    if item is not None:
+        return {"status": 1, "product": item}, 200
+    return {"status": 0, "error": "Item not found"}, 404
+
+
+async def delete_item(item_id):
+    """Remove an inventory item."""
+    deleted_item = await call_store('delete_item', item_id)
+    if deleted_item is not None:
+        return {"status": 1, "message": "Item deleted", "product": deleted_item}, 200
+    return {"status": 0, "error": "Item not found"}, 404
+
+
+async def handle_request(scope, receive):
+    """Route a request and return (payload, status, extra headers)."""
+    match = ROUTE.match(scope['path'])
+    if not match:
+        return {"status": 0, "error": "Not found"}, 404, ()
+
+    # HEAD is answered like GET; send_json drops the body
+    method = 'GET' if scope['method'] == 'HEAD' else scope['method']
+    if match.group(1) is None:
+        allowed = ('GET', 'HEAD', 'OPTIONS', 'POST')
+        if method == 'GET':
+            return (*await get_all_items(), ())
+        if method == 'POST':
+            return (*await add_item(await read_json(scope, receive)), ())
+    else:
+        item_id = int(match.group(1))
+        allowed = ('GET', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE')
+        if method == 'GET':
+            return (*await get_item(item_id), ())
+        if method == 'PATCH':
+            return (*await update_item(item_id, await read_json(scope, receive)), ())
+        if method == 'DELETE':
+            return (*await delete_item(item_id), ())
+
+    allow_header = ((b'allow', ', '.join(allowed).encode()),)
+    if method == 'OPTIONS':
+        return None, 200, allow_header
+    return {"status": 0, "error": "Method not allowed"}, 405, allow_header
+
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({"type": "lifespan.startup.complete"})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope['type'] != 'http':
+        return
+
+    try:
+        payload, status, headers = await handle_request(scope, receive)
+    except RequestError as e:
+        payload, status, headers = {"status": 0, "error": e.error}, e.status, ()
+    except Exception:
+        # Answer like Flask instead of leaving the response to the server
+        logger.exception("Error handling %s %s", scope['method'], scope['path'])
+        payload, status, headers = {"status": 0, "error": "Internal server error"}, 500, ()
+    await send_json(send, payload, status, headers, head=scope['method'] == 'HEAD')
@@ -0,0 +1,68 @@
+"""
+Offline Index Lookup Benchmark
+Builds a synthetic OpenFoodFacts dump, indexes it with offline_index.py and
+times barcode lookups and name searches for common and rare terms.
+
+    python bench_offline_index.py --products 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+import offline_index
+
+WORDS = ["oat", "soy", "chocolate", "bread", "organic", "chips", "juice", "yogurt",
+         "cheese", "almond", "rice", "tomato", "sauce", "coffee", "tea", "honey"]
+
+
+def write_dump(path, products):
+    """Write a JSONL dump in which every product name contains 'milk'."""
+    rng = random.Random(0)
+    with open(path, 'w') as f:
+        for i in range(products):
+            words = rng.sample(WORDS, 3)
+            f.write(json.dumps({
+                "code": str(10 ** 12 + i),
+                "product_name": " ".join(words + ["milk", f"item{i}"]),
+                "brands": rng.choice(["Silk", "Oatly", "Alpro", "Danone"])
+            }) + "\n")
+
+
+def time_call(func, *args, runs=200):
+    """Return the mean time of func(*args) in milliseconds."""
+    func(*args)
+    start = time.perf_counter()
+    for _ in range(runs):
+        func(*args)
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main():
+    """Build the index and print lookup timings."""
+    parser = argparse.ArgumentParser(description="Benchmark offline index lookups.")
+    parser.add_argument('--products', type=int, default=300000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = os.path.join(tmp, 'dump.jsonl')
+        index_path = os.path.join(tmp, 'products.db')
+        write_dump(dump_path, args.products)
+
+        start = time.perf_counter()
+        offline_index.build_index(dump_path, index_path)
+        print(f"Indexed {args.products} products in {time.perf_counter() - start:.1f}s")
+
+        barcode = str(10 ** 12 + args.products // 2)
+        elapsed = time_call(offline_index.lookup_barcode, index_path, barcode)
+        print(f"  {'barcode lookup':<28} {elapsed:>8.3f} ms")
+        for term in ("milk", "oat milk", "chocolate almond", f"item{args.products // 2}"):
+            elapsed = time_call(offline_index.search_name, index_path, term)
+            print(f"  {'search ' + repr(term):<28} {elapsed:>8.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Read Throughput Benchmark for serve.py
+Starts the server with an increasing number of workers and measures how
+many GET /inventory requests per second it answers.
+
+    python bench_serve.py --duration 5 --clients 16
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HOST = '127.0.0.1'
+
+
+def client_loop(port, duration, counter):
+    """Send GET /inventory until time runs out, counting successful responses."""
+    conn = http.client.HTTPConnection(HOST, port, timeout=10)
+    done = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        conn.request('GET', '/inventory')
+        response = conn.getresponse()
+        response.read()
+        # Rejections (429/503) are cheap and would inflate throughput
+        if response.status == 200:
+            done += 1
+    conn.close()
+    with counter.get_lock():
+        counter.value += done
+
+
+def wait_for_server(port, timeout=10):
+    """Poll until the server accepts requests."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(HOST, port, timeout=1)
+            conn.request('GET', '/inventory')
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+
+def measure(workers, port, clients, duration, db_path):
+    """Return requests per second for one worker count."""
+    server = subprocess.Popen(
+        [sys.executable, 'serve.py', '--workers', str(workers),
+         '--port', str(port), '--db', db_path, '--no-rate-limit'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_server(port)
+        counter = multiprocessing.Value('i', 0)
+        procs = [multiprocessing.Process(target=client_loop, args=(port, duration, counter))
+                 for _ in range(clients)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        return counter.value / duration
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    """Run the benchmark for 1, 2, 4, ... workers up to the CPU count."""
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark serve.py read throughput.")
+    parser.add_argument('--max-workers', type=int, default=cpus)
+    parser.add_argument('--clients', type=int, default=2 * cpus)
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    counts = []
+    workers = 1
+    while workers < args.max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(args.max_workers)
+
+    # Note: client processes share the machine, so leave cores free for them
+    print(f"{cpus} CPUs, {args.clients} client processes, {args.duration}s per run")
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = None
+        for count in counts:
+            rate = measure(count, args.port, args.clients, args.duration,
+                           os.path.join(tmp, 'bench.db'))
+            baseline = baseline or rate
+            print(f"{count:>8} {rate:>10.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Startup Time Benchmark
+Measures module import cost (python -X importtime), one-shot CLI command
+latency, and server cold start to first response.
+
+    python bench_startup.py --runs 20
+"""
+
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HOST = '127.0.0.1'
+
+
+def import_cost(module):
+    """Return the cumulative import time of `module` in milliseconds."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=HERE, capture_output=True, text=True, check=True)
+    # Lines look like "import time: self [us] | cumulative | name"
+    for line in reversed(result.stderr.splitlines()):
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def run_time(args, runs, env=None):
+    """Return the median wall time in milliseconds of running a Python command."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=HERE, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def start_server(port, db_path):
+    """Start serve.py and return (process, ms until it answered its first request)."""
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, 'serve.py', '--workers', '1', '--port', str(port), '--db', db_path,
+         '--no-rate-limit'],
+        cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = start + 10
+    while time.perf_counter() < deadline:
+        try:
+            conn = http.client.HTTPConnection(HOST, port, timeout=1)
+            conn.request('GET', '/inventory')
+            conn.getresponse().read()
+            return server, (time.perf_counter() - start) * 1000
+        except OSError:
+            time.sleep(0.005)
+    server.terminate()
+    raise RuntimeError("Server did not start")
+
+
+def main():
+    """Print import costs and cold-start timings."""
+    parser = argparse.ArgumentParser(description="Benchmark startup time.")
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--port', type=int, default=5056)
+    args = parser.parse_args()
+
+    print("Import cost (cumulative, -X importtime):")
+    for module in ('cli', 'openfoodfacts_api', 'app', 'requests'):
+        print(f"  {module:<20} {import_cost(module):>8.1f} ms")
+
+    print(f"\nWall time, median of {args.runs} runs:")
+    print(f"  {'python -c pass':<28} {run_time(['-c', 'pass'], args.runs):>8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server, first_response = start_server(args.port, os.path.join(tmp, 'bench.db'))
+        try:
+            env = dict(os.environ, INVENTORY_API_URL=f"http://{HOST}:{args.port}")
+            list_time = run_time(['cli.py', 'list'], args.runs, env)
+            print(f"  {'cli.py list (to response)':<28} {list_time:>8.1f} ms")
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"  {'serve.py to first response':<28} {first_response:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,14 @@ CLI Frontend for Inventory Management System
 Allows users to interact with the Flask API through command line.
 """
 
-import requests
-from openfoodfacts_api import search_product_by_barcode, search_product_by_name
+import os
+import sys
 
-# Base URL for our Flask API
-API_URL = "http://127.0.0.1:5000"
+# requests and openfoodfacts_api are imported inside the functions that use
+# them, so menu options and scripted commands that don't need them start fast
+
+# Base URL for our Flask API (override with INVENTORY_API_URL)
+API_URL = os.environ.get("INVENTORY_API_URL", "http://127.0.0.1:5000")
 
 
 def display_menu():
@@ -25,26 +28,62 @@ def display_menu():
     print("===================================")
 
 
+def print_items(items):
+    """Display a list of inventory items."""
+    if items:
+        print("\n--- All Inventory Items ---")
+        for item in items:
+            print(f"ID: {item['id']}")
+            print(f"  Name: {item['product_name']}")
+            print(f"  Brand: {item['brands']}")
+            print(f"  Barcode: {item['barcode']}")
+            print(f"  Quantity: {item['quantity']}")
+            print(f"  Price: ${item['price']:.2f}")
+            print("-" * 30)
+    else:
+        print("No items in inventory.")
+
+
+def print_item(item):
+    """Display the full details of one inventory item."""
+    print("\n--- Item Details ---")
+    print(f"ID: {item['id']}")
+    print(f"Name: {item['product_name']}")
+    print(f"Brand: {item['brands']}")
+    print(f"Barcode: {item['barcode']}")
+    print(f"Ingredients: {item['ingredients_text']}")
+    print(f"Quantity: {item['quantity']}")
+    print(f"Price: ${item['price']:.2f}")
+
+
+def print_product(product):
+    """Display an OpenFoodFacts product."""
+    print("\n--- Product Found ---")
+    print(f"Name: {product['product_name']}")
+    print(f"Brand: {product['brands']}")
+    print(f"Barcode: {product['barcode']}")
+    print(f"Ingredients: {product['ingredients_text'][:100]}..." if len(product.get('ingredients_text', '')) > 100 else f"Ingredients: {product.get('ingredients_text', 'N/A')}")
+
+
+def print_products(products):
+    """Display a list of OpenFoodFacts search results."""
+    print(f"\n--- Found {len(products)} products ---")
+    for i, product in enumerate(products, 1):
+        print(f"{i}. {product['product_name']} ({product['brands']})")
+        print(f"   Barcode: {product['barcode']}")
+
+
 def view_all_items():
     """Fetch and display all inventory items."""
+    import requests
+
     try:
         response = requests.get(f"{API_URL}/inventory", timeout=5)
         data = response.json()
 
         if data['status'] == 1:
             items = data['items']
-            if items:
-                print("\n--- All Inventory Items ---")
-                for item in items:
-                    print(f"ID: {item['id']}")
-                    print(f"  Name: {item['product_name']}")
-                    print(f"  Brand: {item['brands']}")
-                    print(f"  Barcode: {item['barcode']}")
-                    print(f"  Quantity: {item['quantity']}")
-                    print(f"  Price: ${item['price']:.2f}")
-                    print("-" * 30)
-            else:
-                print("No items in inventory.")
+            print_items(items)
         else:
             print(f"Error: {data.get('error', 'Unknown error')}")
 
@@ -56,6 +95,8 @@ def view_all_items():
 
 def view_single_item():
     """Fetch and display a single item by ID."""
+    import requests
+
     try:
         item_id = input("Enter item ID: ").strip()
         if not item_id.isdigit():
@@ -66,15 +107,7 @@ def view_single_item():
         data = response.json()
 
         if data['status'] == 1:
-            item = data['product']
-            print("\n--- Item Details ---")
-            print(f"ID: {item['id']}")
-            print(f"Name: {item['product_name']}")
-            print(f"Brand: {item['brands']}")
-            print(f"Barcode: {item['barcode']}")
-            print(f"Ingredients: {item['ingredients_text']}")
-            print(f"Quantity: {item['quantity']}")
-            print(f"Price: ${item['price']:.2f}")
+            print_item(data['product'])
         else:
             print(f"Error: {data.get('error', 'Item not found')}")
 
@@ -86,6 +119,8 @@ def view_single_item():
 
 def add_item():
     """Add a new item to inventory."""
+    import requests
+
     try:
         print("\n--- Add New Item ---")
         product_name = input("Product name: ").strip()
@@ -136,6 +171,8 @@ def add_item():
 
 def update_item():
     """Update an existing item's price or quantity."""
+    import requests
+
     try:
         item_id = input("Enter item ID to update: ").strip()
         if not item_id.isdigit():
@@ -190,6 +227,8 @@ def update_item():
 
 def delete_item():
     """Delete an item from inventory."""
+    import requests
+
     try:
         item_id = input("Enter item ID to delete: ").strip()
         if not item_id.isdigit():
@@ -217,6 +256,8 @@ def delete_item():
 
 def search_by_barcode():
     """Search OpenFoodFacts API by barcode."""
+    from openfoodfacts_api import search_product_by_barcode
+
     barcode = input("Enter barcode: ").strip()
     if not barcode:
         print("Error: Barcode is required.")
@@ -226,18 +267,15 @@ def search_by_barcode():
     result = search_product_by_barcode(barcode)
 
     if result['status'] == 1:
-        product = result['product']
-        print("\n--- Product Found ---")
-        print(f"Name: {product['product_name']}")
-        print(f"Brand: {product['brands']}")
-        print(f"Barcode: {product['barcode']}")
-        print(f"Ingredients: {product['ingredients_text'][:100]}..." if len(product.get('ingredients_text', '')) > 100 else f"Ingredients: {product.get('ingredients_text', 'N/A')}")
+        print_product(result['product'])
     else:
         print(f"Error: {result.get('error', 'Product not found')}")
 
 
 def search_by_name():
     """Search OpenFoodFacts API by product name."""
+    from openfoodfacts_api import search_product_by_name
+
     name = input("Enter product name: ").strip()
     if not name:
         print("Error: Product name is required.")
@@ -247,17 +285,16 @@ def search_by_name():
     result = search_product_by_name(name)
 
     if result['status'] == 1:
-        products = result['products']
-        print(f"\n--- Found {len(products)} products ---")
-        for i, product in enumerate(products, 1):
-            print(f"{i}. {product['product_name']} ({product['brands']})")
-            print(f"   Barcode: {product['barcode']}")
+        print_products(result['products'])
     else:
         print(f"Error: {result.get('error', 'No products found')}")
 
 
 def add_from_openfoodfacts():
     """Add an item to inventory using data from OpenFoodFacts."""
+    import requests
+    from openfoodfacts_api import search_product_by_barcode
+
     barcode = input("Enter barcode to fetch from OpenFoodFacts: ").strip()
     if not barcode:
         print("Error: Barcode is required.")
@@ -313,6 +350,109 @@ def add_from_openfoodfacts():
         print(f"Error: {str(e)}")
 
 
+# Scripted Commands
+# One-shot commands for shell scripts, e.g. `python cli.py get 3`. They talk
+# to the API through http.client instead of requests, which keeps startup
+# within a few tens of milliseconds of the bare interpreter.
+
+SCRIPT_USAGE = """Usage: python cli.py [command]
+  (no command)      Interactive menu
+  list              View all inventory items
+  get <id>          View single item by ID
+  delete <id>       Delete item (no confirmation)
+  barcode <code>    Search OpenFoodFacts by barcode
+  search <name>     Search OpenFoodFacts by name"""
+
+
+def api_call(method, path):
+    """
+    Send a request to the Flask API with http.client and return the JSON body.
+
+    Args:
+        method: HTTP method, e.g. 'GET'
+        path: API path below API_URL, e.g. '/inventory/3'
+
+    Returns:
+        Decoded JSON response (error responses carry "status": 0)
+    """
+    import http.client
+    import json
+    from urllib.parse import urlsplit
+
+    url = urlsplit(API_URL)
+    if url.scheme == 'http':
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+    elif url.scheme == 'https':
+        conn = http.client.HTTPSConnection(url.hostname, url.port, timeout=5)
+    else:
+        raise ValueError(f"Unsupported API URL scheme: {API_URL}")
+
+    try:
+        conn.request(method, url.path.rstrip('/') + path)
+        response = conn.getresponse()
+        body = response.read()
+    finally:
+        conn.close()
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        raise RuntimeError(f"API error: {response.status}") from None
+
+
+def run_command(args):
+    """
+    Run one scripted command.
+
+    Args:
+        args: Command-line arguments after the script name
+
+    Returns:
+        Process exit status (0 on success)
+    """
+    command, params = args[0], args[1:]
+
+    try:
+        if command == 'list' and not params:
+            data = api_call('GET', '/inventory')
+            if data['status'] == 1:
+                print_items(data['items'])
+                return 0
+        elif command in ('get', 'delete') and len(params) == 1 and params[0].isdigit():
+            method = 'GET' if command == 'get' else 'DELETE'
+            data = api_call(method, f"/inventory/{params[0]}")
+            if data['status'] == 1:
+                if command == 'get':
+                    print_item(data['product'])
+                else:
+                    print(f"Item '{data['product']['product_name']}' deleted successfully!")
+                return 0
+        elif command == 'barcode' and len(params) == 1:
+            from openfoodfacts_api import search_product_by_barcode
+            data = search_product_by_barcode(params[0])
+            if data['status'] == 1:
+                print_product(data['product'])
+                return 0
+        elif command == 'search' and params:
+            from openfoodfacts_api import search_product_by_name
+            data = search_product_by_name(' '.join(params))
+            if data['status'] == 1:
+                print_products(data['products'])
+                return 0
+        else:
+            print(SCRIPT_USAGE)
+            return 2
+    except ConnectionError:
+        print("Error: Cannot connect to API. Make sure the server is running.")
+        return 1
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return 1
+
+    print(f"Error: {data.get('error', 'Unknown error')}")
+    return 1
+
+
 def main():
     """Main function to run the CLI application."""
     print("Welcome to the Inventory Management System!")
@@ -346,4 +486,6 @@ def main():
 
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(run_command(sys.argv[1:]))
     main()
@@ -0,0 +1,241 @@
+"""
+Inventory Storage Backends
+MemoryStore keeps items in a plain list for development and tests.
+SQLiteStore keeps items in a SQLite file so several server processes
+can share the same inventory.
+"""
+
+import threading
+
+# Fields a client can set on an item, with their defaults
+FIELD_DEFAULTS = {
+    "barcode": '',
+    "product_name": '',
+    "brands": '',
+    "ingredients_text": '',
+    "quantity": 0,
+    "price": 0.0
+}
+
+
+class MemoryStore:
+    """Inventory held in a Python list, local to a single process."""
+
+    def __init__(self, items):
+        # Keep a reference to the list so callers can still manipulate it directly
+        self.items = items
+        self.next_id = max((item['id'] for item in items), default=0) + 1
+
+    def all_items(self):
+        """Return every item."""
+        return self.items
+
+    def get_item(self, item_id):
+        """Return the item with the given ID, or None."""
+        for item in self.items:
+            if item['id'] == item_id:
+                return item
+        return None
+
+    def add_item(self, data):
+        """Create an item from the provided fields and return it."""
+        new_item = {"id": self.next_id}
+        for field, default in FIELD_DEFAULTS.items():
+            new_item[field] = data.get(field, default)
+
+        self.items.append(new_item)
+        self.next_id += 1
+        return new_item
+
+    def update_item(self, item_id, data):
+        """Update only the provided fields; return the item, or None if missing."""
+        item = self.get_item(item_id)
+        if item is None:
+            return None
+        for field in FIELD_DEFAULTS:
+            if field in data:
+                item[field] = data[field]
+        return item
+
+    def delete_item(self, item_id):
+        """Remove an item and return it, or None if missing."""
+        for i, item in enumerate(self.items):
+            if item['id'] == item_id:
+                return self.items.pop(i)
+        return None
+
+
+class SQLiteStore:
+    """
+    Inventory held in a SQLite file, shared by every process that opens it.
+
+    Reads are served from an in-process snapshot. Every write also appends
+    the changed item's ID to a `changes` log in the same transaction. Before
+    each read a process fetches the log entries newer than its snapshot and
+    reloads just those rows, so a write costs other processes O(changed rows),
+    not a reload of the whole table. A process that falls more than
+    CHANGE_LOG_SIZE writes behind does one full reload.
+
+    Each store uses a single connection, guarded by a lock; open one store
+    per process (after forking) and close it when done.
+    """
+
+    # Change log entries kept for processes catching up incrementally
+    CHANGE_LOG_SIZE = 1000
+
+    def __init__(self, path):
+        # Imported here so the default in-memory setup doesn't pay for sqlite3
+        import sqlite3
+
+        self.path = path
+        self._lock = threading.RLock()
+        self._version = None
+        self._by_id = {}
+        self._items = None
+
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS inventory (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                barcode TEXT,
+                product_name TEXT,
+                brands TEXT,
+                ingredients_text TEXT,
+                quantity INTEGER,
+                price REAL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS changes (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_id INTEGER NOT NULL
+            )
+        """)
+
+    def close(self):
+        """Close the store's database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _write(self, sql, params, item_id=None):
+        """
+        Run one write statement and log the change in a single transaction.
+
+        Returns:
+            (rowcount, item_id), where item_id defaults to the inserted row's ID
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(sql, params)
+                rowcount = cursor.rowcount
+                item_id = cursor.lastrowid if item_id is None else item_id
+                if rowcount:
+                    version = conn.execute("INSERT INTO changes (item_id) VALUES (?)",
+                                           (item_id,)).lastrowid
+                    conn.execute("DELETE FROM changes WHERE version <= ?",
+                                 (version - self.CHANGE_LOG_SIZE,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return rowcount, item_id
+
+    def _fetch(self, item_id):
+        """Read one item straight from the database, or None."""
+        row = self._conn.execute("SELECT * FROM inventory WHERE id = ?", (item_id,)).fetchone()
+        return dict(row) if row else None
+
+    def _full_reload(self):
+        """Replace the snapshot with the whole table."""
+        conn = self._conn
+        # One read transaction so the version matches the rows
+        conn.execute("BEGIN")
+        try:
+            version = conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+            rows = conn.execute("SELECT * FROM inventory ORDER BY id").fetchall()
+        finally:
+            conn.execute("COMMIT")
+        self._by_id = {row['id']: dict(row) for row in rows}
+        self._items = None
+        self._version = version
+
+    def _refresh(self):
+        """Bring the snapshot up to date with writes from any process."""
+        if self._version is None:
+            self._full_reload()
+            return
+
+        changes = self._conn.execute(
+            "SELECT version, item_id FROM changes WHERE version > ? ORDER BY version",
+            (self._version,)
+        ).fetchall()
+        if not changes:
+            return
+        if changes[0]['version'] != self._version + 1:
+            # Entries we needed were pruned from the log
+            self._full_reload()
+            return
+
+        for item_id in {change['item_id'] for change in changes}:
+            item = self._fetch(item_id)
+            if item is None:
+                self._by_id.pop(item_id, None)
+            else:
+                # IDs only grow, so new items land at the end and order holds
+                self._by_id[item_id] = item
+        self._items = None
+        self._version = changes[-1]['version']
+
+    def seed(self, items):
+        """Insert the given items if the store is empty."""
+        if self.all_items():
+            return
+        for item in items:
+            self.add_item(item)
+
+    def all_items(self):
+        """Return every item."""
+        with self._lock:
+            self._refresh()
+            if self._items is None:
+                self._items = list(self._by_id.values())
+            return self._items
+
+    def get_item(self, item_id):
+        """Return the item with the given ID, or None."""
+        with self._lock:
+            self._refresh()
+            return self._by_id.get(item_id)
+
+    def add_item(self, data):
+        """Create an item from the provided fields and return it."""
+        values = [data.get(field, default) for field, default in FIELD_DEFAULTS.items()]
+        _, item_id = self._write(
+            f"INSERT INTO inventory ({', '.join(FIELD_DEFAULTS)}) VALUES (?, ?, ?, ?, ?, ?)",
+            values
+        )
+        return {"id": item_id, **dict(zip(FIELD_DEFAULTS, values))}
+
+    def update_item(self, item_id, data):
+        """Update only the provided fields; return the item, or None if missing."""
+        fields = [field for field in FIELD_DEFAULTS if field in data]
+        with self._lock:
+            if fields:
+                assignments = ', '.join(f"{field} = ?" for field in fields)
+                self._write(f"UPDATE inventory SET {assignments} WHERE id = ?",
+                            [data[field] for field in fields] + [item_id], item_id)
+            return self._fetch(item_id)
+
+    def delete_item(self, item_id):
+        """Remove an item and return it, or None if missing."""
+        with self._lock:
+            item = self._fetch(item_id)
+            if item is None:
+                return None
+            rowcount, _ = self._write("DELETE FROM inventory WHERE id = ?", (item_id,), item_id)
+            return item if rowcount else None
@@ -0,0 +1,244 @@
+"""
+Offline OpenFoodFacts Product Index
+Imports an OpenFoodFacts JSONL or CSV export into a local SQLite index so
+barcode and name lookups work without the network.
+
+Build an index (plain or .gz dumps are both accepted):
+    python offline_index.py openfoodfacts-products.jsonl.gz products.db
+"""
+
+import csv
+import gzip
+import json
+import sqlite3
+import sys
+
+# Rows are written in batches so memory use stays flat on multi-gigabyte dumps
+BATCH_SIZE = 10000
+
+# Longest CSV field accepted; rows with anything longer are skipped
+MAX_FIELD_SIZE = 1024 * 1024
+
+# Fields kept from each product, matching what openfoodfacts_api returns
+FIELDS = ("product_name", "brands", "ingredients_text", "categories", "image_url")
+
+# Name searches rank at most this many full-text matches, so a common word
+# costs about the same on a million-row index as on a small one
+SEARCH_CANDIDATES = 200
+
+# Open read-only connections, keyed by index path
+_connections = {}
+
+
+def _open_dump(dump_path):
+    """Open a dump file as text, transparently handling gzip."""
+    if dump_path.endswith('.gz'):
+        return gzip.open(dump_path, 'rt', encoding='utf-8', errors='replace')
+    return open(dump_path, 'r', encoding='utf-8', errors='replace', newline='')
+
+
+def _iter_jsonl(f):
+    """Yield product dicts from a JSONL dump, skipping malformed lines."""
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            product = json.loads(line)
+        except ValueError:
+            continue
+        # Valid JSON that isn't an object (a number, a list) isn't a product either
+        if isinstance(product, dict):
+            yield product
+
+
+def _iter_csv(f):
+    """Yield product dicts from a CSV dump, skipping rows that can't be parsed."""
+    csv.field_size_limit(MAX_FIELD_SIZE)
+    first_line = f.readline()
+    # The official export is tab-separated and doesn't quote its fields, so a
+    # stray quote in a product name must not start a quoted field
+    if '\t' in first_line:
+        options = {"delimiter": '\t', "quoting": csv.QUOTE_NONE}
+    else:
+        options = {"delimiter": ','}
+    header = next(csv.reader([first_line], **options))
+
+    rows = csv.DictReader(f, fieldnames=header, **options)
+    while True:
+        try:
+            yield next(rows)
+        except StopIteration:
+            return
+        except csv.Error:
+            # Field over MAX_FIELD_SIZE, e.g. an unbalanced quote in a comma-separated dump
+            continue
+
+
+def _iter_products(dump_path):
+    """Yield (code, name, brands, ingredients, categories, image) tuples from a dump."""
+    name = dump_path[:-3] if dump_path.endswith('.gz') else dump_path
+    reader = _iter_csv if name.endswith(('.csv', '.tsv')) else _iter_jsonl
+
+    with _open_dump(dump_path) as f:
+        for product in reader(f):
+            code = str(product.get('code') or '').strip()
+            if not code:
+                continue
+            yield (code,) + tuple(str(product.get(field) or '') for field in FIELDS)
+
+
+def build_index(dump_path, index_path):
+    """
+    Stream an OpenFoodFacts dump into a SQLite index.
+
+    Args:
+        dump_path: Path to a .jsonl or .csv export, optionally gzipped
+        index_path: Path of the SQLite file to create or extend
+
+    Returns:
+        Number of product rows read from the dump
+    """
+    conn = sqlite3.connect(index_path)
+    try:
+        # Bulk-load settings: the index can simply be rebuilt if an import dies
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                code TEXT PRIMARY KEY,
+                product_name TEXT,
+                brands TEXT,
+                ingredients_text TEXT,
+                categories TEXT,
+                image_url TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                product_name, brands, content='products', content_rowid='rowid'
+            )
+        """)
+
+        insert = "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?)"
+        count = 0
+        batch = []
+        for row in _iter_products(dump_path):
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                conn.executemany(insert, batch)
+                conn.commit()
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.executemany(insert, batch)
+            count += len(batch)
+
+        # Building the full-text index once at the end is much faster than per row
+        conn.execute("INSERT INTO products_fts(products_fts) VALUES('rebuild')")
+        conn.commit()
+        return count
+    finally:
+        conn.close()
+
+
+def _get_connection(index_path):
+    """Return a cached read-only connection to the index, or None if it can't be opened."""
+    conn = _connections.get(index_path)
+    if conn is None:
+        try:
+            conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True,
+                                   check_same_thread=False)
+        except sqlite3.Error:
+            return None
+        conn.row_factory = sqlite3.Row
+        _connections[index_path] = conn
+    return conn
+
+
+def lookup_barcode(index_path, barcode):
+    """
+    Look up a single product in the local index.
+
+    Args:
+        index_path: Path to an index built with build_index
+        barcode: The product barcode to search for
+
+    Returns:
+        Product dictionary, or None if the barcode isn't indexed
+    """
+    conn = _get_connection(index_path)
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT * FROM products WHERE code = ?", (barcode,)).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+
+    return {
+        "barcode": row['code'],
+        "product_name": row['product_name'] or 'Unknown',
+        "brands": row['brands'] or 'Unknown',
+        "ingredients_text": row['ingredients_text'],
+        "categories": row['categories'],
+        "image_url": row['image_url']
+    }
+
+
+def search_name(index_path, name, limit=5):
+    """
+    Full-text search the local index by product name or brand.
+
+    Args:
+        index_path: Path to an index built with build_index
+        name: The product name to search for
+        limit: Maximum number of products to return
+
+    Returns:
+        List of product dictionaries (empty if nothing matched)
+    """
+    conn = _get_connection(index_path)
+    terms = name.split()
+    if conn is None or not terms:
+        return []
+
+    # Quote every term so user input can't be parsed as FTS query syntax
+    query = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+    try:
+        # bm25 ranking reads every match's doclist, which takes seconds for a
+        # common word on a full dump; take the first SEARCH_CANDIDATES matches instead
+        rows = conn.execute("""
+            SELECT p.code, p.product_name, p.brands, p.ingredients_text
+            FROM (
+                SELECT rowid
+                FROM products_fts
+                WHERE products_fts MATCH ?
+                LIMIT ?
+            ) AS candidates
+            JOIN products p ON p.rowid = candidates.rowid
+        """, (query, SEARCH_CANDIDATES)).fetchall()
+    except sqlite3.Error:
+        return []
+
+    # Cheap ranking of the candidates: names containing the whole phrase first,
+    # then shorter names, which match the query more closely
+    phrase = " ".join(terms).lower()
+    rows.sort(key=lambda row: (phrase not in (row['product_name'] or '').lower(),
+                               len(row['product_name'] or '')))
+
+    return [{
+        "barcode": row['code'],
+        "product_name": row['product_name'] or 'Unknown',
+        "brands": row['brands'] or 'Unknown',
+        "ingredients_text": row['ingredients_text']
+    } for row in rows[:limit]]
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Usage: python offline_index.py <dump.jsonl[.gz]|dump.csv[.gz]> <index.db>")
+        sys.exit(1)
+    total = build_index(sys.argv[1], sys.argv[2])
+    print(f"Indexed {total} products into {sys.argv[2]}")
@@ -3,11 +3,17 @@ OpenFoodFacts API Integration Module
 Fetches product details from the OpenFoodFacts external API.
 """
 
-import requests
+import os
+
+# requests and offline_index are imported on first use, so importing this
+# module stays cheap and offline hits never load the HTTP stack
 
 # Base URL for OpenFoodFacts API
 BASE_URL = "https://world.openfoodfacts.org/api/v2"
 
+# Optional local index built by offline_index.py, checked before the network
+OFFLINE_INDEX_PATH = os.environ.get("OFFLINE_INDEX_PATH")
+
 
 def search_product_by_barcode(barcode):
     """
@@ -19,6 +25,14 @@ def search_product_by_barcode(barcode):
     Returns:
         Dictionary with product data or error information
     """
+    if OFFLINE_INDEX_PATH:
+        import offline_index
+        product = offline_index.lookup_barcode(OFFLINE_INDEX_PATH, barcode)
+        if product:
+            return {"status": 1, "product": product}
+
+    import requests
+
     try:
         url = f"{BASE_URL}/product/{barcode}"
         response = requests.get(url, timeout=10)
@@ -59,6 +73,14 @@ def search_product_by_name(name):
     Returns:
         Dictionary with list of matching products or error information
     """
+    if OFFLINE_INDEX_PATH:
+        import offline_index
+        products = offline_index.search_name(OFFLINE_INDEX_PATH, name)
+        if products:
+            return {"status": 1, "products": products}
+
+    import requests
+
     try:
         url = f"{BASE_URL}/search"
         params = {
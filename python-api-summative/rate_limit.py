@@ -0,0 +1,167 @@
+"""
+Rate Limiting and Admission Control
+Token buckets limit how fast each client can call each route, and an
+admission controller sheds load when the server is already too busy.
+State is per process, so under serve.py each worker enforces its own limits.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts up to `burst`."""
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, now):
+        """Add the tokens earned since the last update."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Spend one token; return 0 if allowed, else seconds until one is available."""
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Token bucket per (client, route) key.
+
+    At most `max_buckets` keys are tracked. When a new key arrives at the cap,
+    the least recently seen key is dropped. That client starts again with a
+    full bucket, even if it was being limited. Many new keys can therefore
+    reset other clients' limits. This includes forged X-Forwarded-For values
+    when proxies are trusted. evicted_active_total counts evictions of buckets
+    that weren't full, so that churn shows up in stats().
+    """
+
+    def __init__(self, rate, burst, max_buckets=10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()
+        self.allowed_total = 0
+        self.limited_total = 0
+        self.evicted_total = 0
+        self.evicted_active_total = 0
+        self._lock = threading.Lock()
+
+    def check(self, key):
+        """Record a request for `key`; return 0 if allowed, else seconds to wait."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = TokenBucket(self.rate, self.burst, now)
+                if len(self.buckets) > self.max_buckets:
+                    _, evicted = self.buckets.popitem(last=False)
+                    self.evicted_total += 1
+                    evicted.refill(now)
+                    if evicted.tokens < evicted.burst:
+                        self.evicted_active_total += 1
+            else:
+                self.buckets.move_to_end(key)
+
+            wait = bucket.take(now)
+            if wait:
+                self.limited_total += 1
+            else:
+                self.allowed_total += 1
+            return wait
+
+    def stats(self):
+        """Return limiter settings and counters."""
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tracked_keys": len(self.buckets),
+                "max_buckets": self.max_buckets,
+                "allowed_total": self.allowed_total,
+                "limited_total": self.limited_total,
+                "evicted_total": self.evicted_total,
+                "evicted_active_total": self.evicted_active_total
+            }
+
+
+class AdmissionController:
+    """Rejects requests when too many are in flight or they queued too long."""
+
+    def __init__(self, max_in_flight, max_queue_latency):
+        self.max_in_flight = max_in_flight
+        self.max_queue_latency = max_queue_latency
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.last_queue_latency = 0.0
+        self.shed_total = 0
+        self._lock = threading.Lock()
+
+    def enter(self, queue_latency=0.0):
+        """Try to admit a request; return True if admitted (call leave() when done)."""
+        with self._lock:
+            self.last_queue_latency = queue_latency
+            if self.in_flight >= self.max_in_flight or queue_latency > self.max_queue_latency:
+                self.shed_total += 1
+                return False
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return True
+
+    def leave(self):
+        """Mark an admitted request as finished."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self):
+        """Return controller settings and counters."""
+        with self._lock:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "max_queue_latency": self.max_queue_latency,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "last_queue_latency": self.last_queue_latency,
+                "shed_total": self.shed_total
+            }
+
+
+def queue_latency(request_start, now=None):
+    """
+    Seconds a request waited before reaching the app.
+
+    Args:
+        request_start: X-Request-Start header set by the proxy, in the
+            "t=<seconds>" or "<seconds>" form (milli/microseconds also accepted)
+        now: Current Unix time, defaults to time.time()
+
+    Returns:
+        Queue latency in seconds, or 0.0 if the header is missing or invalid
+    """
+    if not request_start:
+        return 0.0
+    try:
+        started = float(request_start.strip().removeprefix('t='))
+    except ValueError:
+        return 0.0
+
+    # Proxies disagree on units; scale milliseconds or microseconds down to seconds
+    while started > 1e11:
+        started /= 1000
+    now = time.time() if now is None else now
+    return max(0.0, now - started)
+
+
+def retry_after(seconds):
+    """Format a wait as a Retry-After header value (whole seconds, at least 1)."""
+    return str(max(1, math.ceil(seconds)))
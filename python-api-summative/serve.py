@@ -0,0 +1,120 @@
+"""
+Multi-Process Server for the Inventory API
+Runs several worker processes that accept connections on one shared socket
+and share inventory through a SQLite file. Each worker runs werkzeug's
+threaded server, and the parent restarts any worker that exits. Put it
+behind a reverse proxy when exposing it to the internet.
+
+    python serve.py --workers 4 --port 5000 --db inventory.db
+"""
+
+import argparse
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from multiprocessing.connection import wait
+
+from werkzeug.serving import make_server
+
+import app as inventory_app
+from inventory_store import SQLiteStore
+from rate_limit import RateLimiter
+
+# A worker that dies sooner than this after starting is restarted after a pause,
+# so a crash on startup doesn't turn into a tight fork loop
+MIN_WORKER_UPTIME = 1.0
+
+
+def run_worker(fd, db_path):
+    """Serve requests from an inherited listening socket."""
+    # The parent's SIGTERM handler is inherited through fork; workers just exit
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # Each worker opens its own connection; SQLite handles can't cross a fork
+    store = inventory_app.store = SQLiteStore(db_path)
+    server = make_server('', 0, inventory_app.app, threaded=True, fd=fd)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+
+
+def supervise(context, fd, db_path, count):
+    """Start `count` workers and restart any that exit, until interrupted."""
+    workers = {}
+
+    def start_worker():
+        worker = context.Process(target=run_worker, args=(fd, db_path))
+        worker.start()
+        workers[worker.sentinel] = (worker, time.monotonic())
+
+    try:
+        for _ in range(count):
+            start_worker()
+        while True:
+            for sentinel in wait(list(workers)):
+                worker, started = workers.pop(sentinel)
+                worker.join()
+                print(f"Worker {worker.pid} exited with code {worker.exitcode}; restarting")
+                if time.monotonic() - started < MIN_WORKER_UPTIME:
+                    time.sleep(MIN_WORKER_UPTIME)
+                start_worker()
+    finally:
+        for worker, _ in workers.values():
+            worker.terminate()
+        for worker, _ in workers.values():
+            worker.join()
+
+
+def main():
+    """Bind the socket, seed the shared store and start the workers."""
+    parser = argparse.ArgumentParser(description="Run the inventory API with multiple workers.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--db', default='inventory.db')
+    parser.add_argument('--rate-limit', type=float, default=inventory_app.RATE_LIMIT,
+                        help="requests per second per client and route")
+    parser.add_argument('--rate-burst', type=float, default=inventory_app.RATE_BURST)
+    parser.add_argument('--no-rate-limit', action='store_true',
+                        help="disable per-client rate limiting (e.g. for benchmarks)")
+    parser.add_argument('--trusted-proxies', type=int, default=0,
+                        help="identify clients by X-Forwarded-For from this many proxies")
+    args = parser.parse_args()
+
+    # Configure the app before forking so every worker inherits the settings
+    if args.no_rate_limit:
+        inventory_app.limiter = None
+    else:
+        inventory_app.limiter = RateLimiter(args.rate_limit, args.rate_burst)
+    if args.trusted_proxies:
+        inventory_app.trust_proxies(args.trusted_proxies)
+
+    # Create the schema and starting items once, before any worker forks
+    seed_store = SQLiteStore(args.db)
+    seed_store.seed(inventory_app.inventory)
+    seed_store.close()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((args.host, args.port))
+    sock.listen(128)
+    sock.set_inheritable(True)
+
+    # Exit cleanly on SIGTERM too, so the workers are never left orphaned
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} workers")
+    # Workers inherit the socket through fork and all accept from it
+    try:
+        supervise(multiprocessing.get_context('fork'), sock.fileno(), args.db, args.workers)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
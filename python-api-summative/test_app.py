@@ -6,9 +6,15 @@ Tests API endpoints, CLI commands, and external API interactions.
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+import os
+import subprocess
+import sys
 
 from app import app, inventory
 from openfoodfacts_api import search_product_by_barcode, search_product_by_name
+import offline_index
+from inventory_store import SQLiteStore
+from rate_limit import AdmissionController, RateLimiter, queue_latency
 
 
 # Flask API Tests
@@ -39,6 +45,17 @@ def reset_inventory():
     ])
 
 
+@pytest.fixture(autouse=True)
+def reset_limits():
+    """Give each test fresh rate limiter and admission state."""
+    import app as app_module
+
+    limiter = RateLimiter(app_module.RATE_LIMIT, app_module.RATE_BURST)
+    admission = AdmissionController(app_module.MAX_IN_FLIGHT, app_module.MAX_QUEUE_LATENCY)
+    with patch('app.limiter', limiter), patch('app.admission', admission):
+        yield
+
+
 # API Endpoint Tests
 
 def test_get_all_items(client):
@@ -98,9 +115,160 @@ def test_delete_item(client):
     assert data['status'] == 1
 
 
+def test_head_and_options(client):
+    """Test HEAD mirrors GET without a body and OPTIONS lists the allowed methods."""
+    response = client.head('/inventory')
+    assert response.status_code == 200
+    assert response.data == b''
+    assert int(response.headers['Content-Length']) > 0
+
+    response = client.options('/inventory/1')
+    assert response.status_code == 200
+    assert set(response.headers['Allow'].split(', ')) == {'GET', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE'}
+
+
+def test_request_body_errors(client):
+    """Test non-JSON and malformed JSON request bodies are rejected."""
+    assert client.post('/inventory', data='{"product_name": "X"}').status_code == 415
+    assert client.post('/inventory', data='{bad', content_type='application/json').status_code == 400
+    assert client.patch('/inventory/1', data='', content_type='application/json').status_code == 400
+
+
+# Shared Store Tests
+
+def test_sqlite_store_routes(client, tmp_path):
+    """Test the API endpoints against the SQLite-backed store."""
+    with patch('app.store', SQLiteStore(str(tmp_path / "inventory.db"))):
+        response = client.post('/inventory', json={"product_name": "Stored", "price": 1.5})
+        item_id = json.loads(response.data)['product']['id']
+
+        response = client.patch(f'/inventory/{item_id}', json={"quantity": 3})
+        assert json.loads(response.data)['product']['quantity'] == 3
+
+        response = client.delete(f'/inventory/{item_id}')
+        assert response.status_code == 200
+        assert client.get(f'/inventory/{item_id}').status_code == 404
+
+
+def test_sqlite_store_sees_other_writers(tmp_path):
+    """Test a store's cached reads pick up writes made through another connection."""
+    path = str(tmp_path / "inventory.db")
+    reader = SQLiteStore(path)
+    writer = SQLiteStore(path)
+    assert reader.all_items() == []
+
+    item = writer.add_item({"product_name": "Shared"})
+    assert reader.get_item(item['id'])['product_name'] == 'Shared'
+
+    assert writer.update_item(item['id'], {"price": 2.5})['price'] == 2.5
+    assert reader.all_items()[0]['price'] == 2.5
+
+    writer.delete_item(item['id'])
+    assert reader.all_items() == []
+
+    reader.close()
+    writer.close()
+
+
+def test_sqlite_store_reloads_after_log_pruned(tmp_path):
+    """Test a reader that fell behind the change log falls back to a full reload."""
+    path = str(tmp_path / "inventory.db")
+    reader = SQLiteStore(path)
+    writer = SQLiteStore(path)
+    writer.CHANGE_LOG_SIZE = 2
+    assert reader.all_items() == []
+
+    for name in ("A", "B", "C", "D"):
+        writer.add_item({"product_name": name})
+
+    assert [item['product_name'] for item in reader.all_items()] == ["A", "B", "C", "D"]
+
+    reader.close()
+    writer.close()
+
+
+# Rate Limiting Tests
+
+def test_rate_limit_per_route(client):
+    """Test a client over its burst gets 429 with Retry-After, per route."""
+    with patch('app.limiter', RateLimiter(rate=1, burst=2)):
+        assert client.get('/inventory').status_code == 200
+        assert client.get('/inventory').status_code == 200
+
+        response = client.get('/inventory')
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '1'
+
+        # Other routes have their own bucket
+        assert client.get('/inventory/1').status_code == 200
+
+        data = json.loads(client.get('/limits').data)
+        assert data['rate_limiter']['limited_total'] == 1
+
+
+def test_admission_sheds_load(client):
+    """Test requests are shed with 503 when in-flight or queue limits are hit."""
+    with patch('app.admission', AdmissionController(max_in_flight=0, max_queue_latency=1.0)):
+        response = client.get('/inventory')
+        assert response.status_code == 503
+        assert 'Retry-After' in response.headers
+
+    admission = AdmissionController(max_in_flight=10, max_queue_latency=1.0)
+    with patch('app.admission', admission):
+        assert client.get('/inventory', headers={'X-Request-Start': 't=1'}).status_code == 503
+        assert client.get('/inventory').status_code == 200
+        assert admission.stats()['in_flight'] == 0
+        assert admission.stats()['shed_total'] == 1
+
+
+def test_rate_limit_disabled(client):
+    """Test setting the limiter to None turns rate limiting off."""
+    with patch('app.limiter', None):
+        for _ in range(5):
+            assert client.get('/inventory').status_code == 200
+        assert json.loads(client.get('/limits').data)['rate_limiter'] is None
+
+
+def test_rate_limit_behind_proxy(client):
+    """Test clients behind a trusted proxy get their own buckets."""
+    from app import trust_proxies
+
+    with patch.object(app, 'wsgi_app', app.wsgi_app), \
+            patch('app.limiter', RateLimiter(rate=1, burst=1)):
+        trust_proxies(1)
+        proxy = {'REMOTE_ADDR': '10.0.0.1'}
+        first = {'X-Forwarded-For': '203.0.113.1'}
+        second = {'X-Forwarded-For': '203.0.113.2'}
+
+        assert client.get('/inventory', headers=first, environ_base=proxy).status_code == 200
+        assert client.get('/inventory', headers=first, environ_base=proxy).status_code == 429
+        assert client.get('/inventory', headers=second, environ_base=proxy).status_code == 200
+
+
+def test_rate_limiter_bucket_cap():
+    """Test the bucket table never grows past max_buckets, evicting the oldest key."""
+    limiter = RateLimiter(rate=0.001, burst=1, max_buckets=2)
+    limiter.check('a')
+    limiter.check('b')
+    limiter.check('a')
+    limiter.check('c')
+
+    assert list(limiter.buckets) == ['a', 'c']
+    # 'b' had spent its token, so evicting it reset an active client
+    assert limiter.stats()['evicted_total'] == 1
+    assert limiter.stats()['evicted_active_total'] == 1
+
+
+def test_queue_latency_units():
+    """Test X-Request-Start parsing across the formats proxies send."""
+    assert queue_latency('t=1700000000.5', now=1700000001.0) == 0.5
+    assert queue_latency('t=1700000000500', now=1700000001.0) == 0.5
+    assert queue_latency('garbage') == 0.0
+
+
 # External API Tests
 
-@patch('openfoodfacts_api.requests.get')
+@patch('requests.get')
 def test_search_by_barcode(mock_get):
     """Test OpenFoodFacts barcode search."""
     mock_response = MagicMock()
@@ -121,7 +289,7 @@ def test_search_by_barcode(mock_get):
     assert result['product']['product_name'] == 'Mock Product'
 
 
-@patch('openfoodfacts_api.requests.get')
+@patch('requests.get')
 def test_search_by_name(mock_get):
     """Test OpenFoodFacts name search."""
     mock_response = MagicMock()
@@ -139,9 +307,96 @@ def test_search_by_name(mock_get):
     assert len(result['products']) == 1
 
 
+# Offline Index Tests
+
+@pytest.fixture
+def offline_db(tmp_path):
+    """Build a small offline index from a JSONL dump."""
+    dump = tmp_path / "dump.jsonl"
+    dump.write_text(
+        json.dumps({"code": "3017620422003", "product_name": "Nutella",
+                    "brands": "Ferrero", "ingredients_text": "Sugar, palm oil"}) + "\n"
+        + "not json\n123\n[1]\n"
+        + json.dumps({"code": "5449000000996", "product_name": "Coca-Cola",
+                      "brands": "Coca-Cola"}) + "\n"
+    )
+    index_path = str(tmp_path / "products.db")
+    assert offline_index.build_index(str(dump), index_path) == 2
+    return index_path
+
+
+def test_offline_index_from_csv(tmp_path):
+    """Test building the offline index from a tab-separated CSV export."""
+    dump = tmp_path / "dump.csv"
+    dump.write_text("code\tproduct_name\tbrands\n123\tOat Milk\tOatly\n")
+    index_path = str(tmp_path / "products.db")
+
+    assert offline_index.build_index(str(dump), index_path) == 1
+    assert offline_index.lookup_barcode(index_path, "123")['brands'] == 'Oatly'
+
+
+def test_offline_index_tsv_with_stray_quote(tmp_path):
+    """Test an unbalanced quote in the unquoted TSV export doesn't swallow later rows."""
+    dump = tmp_path / "dump.csv"
+    dump.write_text("code\tproduct_name\tbrands\n"
+                    "111\t\"Quoted\tC\n"
+                    "444\tBread\tD\n")
+    index_path = str(tmp_path / "products.db")
+
+    assert offline_index.build_index(str(dump), index_path) == 2
+    assert offline_index.lookup_barcode(index_path, "111")['product_name'] == '"Quoted'
+    assert offline_index.lookup_barcode(index_path, "444")['product_name'] == 'Bread'
+
+
+def test_offline_search_common_term(tmp_path):
+    """Test a term matching far more rows than SEARCH_CANDIDATES still returns the best few."""
+    dump = tmp_path / "dump.jsonl"
+    with open(dump, 'w') as f:
+        for i in range(2000):
+            f.write(json.dumps({"code": str(i), "product_name": f"Milk drink {i} oat"}) + "\n")
+        f.write(json.dumps({"code": "9999", "product_name": "Oat Milk"}) + "\n")
+    index_path = str(tmp_path / "products.db")
+    offline_index.build_index(str(dump), index_path)
+
+    with patch('offline_index.SEARCH_CANDIDATES', 5000):
+        products = offline_index.search_name(index_path, "oat milk")
+
+    assert len(products) == 5
+    assert products[0]['barcode'] == '9999'
+    assert len(offline_index.search_name(index_path, "milk")) == 5
+
+
+@patch('requests.get')
+def test_search_by_barcode_offline(mock_get, offline_db):
+    """Test barcode search resolves from the offline index before the network."""
+    with patch('openfoodfacts_api.OFFLINE_INDEX_PATH', offline_db):
+        result = search_product_by_barcode("3017620422003")
+
+    assert result['status'] == 1
+    assert result['product']['product_name'] == 'Nutella'
+    mock_get.assert_not_called()
+
+
+@patch('requests.get')
+def test_search_by_name_offline_fallback(mock_get, offline_db):
+    """Test name search uses the offline index and falls back to the network on a miss."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"products": []}
+    mock_get.return_value = mock_response
+
+    with patch('openfoodfacts_api.OFFLINE_INDEX_PATH', offline_db):
+        result = search_product_by_name("nutella")
+        assert result['products'][0]['barcode'] == '3017620422003'
+        mock_get.assert_not_called()
+
+        search_product_by_name("bread")
+        mock_get.assert_called_once()
+
+
 # CLI Tests
 
-@patch('cli.requests.get')
+@patch('requests.get')
 def test_cli_view_items(mock_get):
     """Test CLI view all items function."""
     mock_response = MagicMock()
@@ -158,7 +413,7 @@ def test_cli_view_items(mock_get):
     mock_get.assert_called_once()
 
 
-@patch('cli.requests.post')
+@patch('requests.post')
 @patch('builtins.input')
 def test_cli_add_item(mock_input, mock_post):
     """Test CLI add item function."""
@@ -173,7 +428,7 @@ def test_cli_add_item(mock_input, mock_post):
     mock_post.assert_called_once()
 
 
-@patch('cli.requests.delete')
+@patch('requests.delete')
 @patch('builtins.input')
 def test_cli_delete_item(mock_input, mock_delete):
     """Test CLI delete item function."""
@@ -188,5 +443,51 @@ def test_cli_delete_item(mock_input, mock_delete):
     mock_delete.assert_called_once()
 
 
+@patch('cli.api_call')
+def test_cli_scripted_commands(mock_api_call, capsys):
+    """Test one-shot CLI commands and their exit statuses."""
+    from cli import run_command
+
+    mock_api_call.return_value = {"status": 1, "product": {
+        "id": 1, "product_name": "Test", "brands": "Brand", "barcode": "123",
+        "ingredients_text": "", "quantity": 10, "price": 5.99}}
+    assert run_command(['get', '1']) == 0
+    mock_api_call.assert_called_once_with('GET', '/inventory/1')
+    assert 'Name: Test' in capsys.readouterr().out
+
+    mock_api_call.return_value = {"status": 0, "error": "Item not found"}
+    assert run_command(['delete', '9']) == 1
+    assert run_command(['get', 'abc']) == 2
+
+
+@patch('http.client.HTTPConnection')
+def test_cli_api_call_url(mock_connection):
+    """Test scripted API calls honour the base URL path, scheme and status."""
+    import cli
+
+    response = mock_connection.return_value.getresponse.return_value
+    response.read.return_value = b'{"status": 1}'
+    with patch('cli.API_URL', 'http://inventory.local:8080/api/'):
+        assert cli.api_call('GET', '/inventory') == {"status": 1}
+        mock_connection.assert_called_once_with('inventory.local', 8080, timeout=5)
+        mock_connection.return_value.request.assert_called_once_with('GET', '/api/inventory')
+
+        response.read.return_value = b'<html>Bad Gateway</html>'
+        response.status = 502
+        with pytest.raises(RuntimeError, match='API error: 502'):
+            cli.api_call('GET', '/inventory')
+
+    with patch('cli.API_URL', 'ftp://inventory.local'):
+        with pytest.raises(ValueError):
+            cli.api_call('GET', '/inventory')
+
+
+def test_cli_import_is_lazy():
+    """Test importing the CLI doesn't pull in requests."""
+    code = "import sys, cli; sys.exit('requests' in sys.modules)"
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    assert subprocess.run([sys.executable, '-c', code], cwd=cwd).returncode == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
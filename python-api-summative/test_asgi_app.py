@@ -0,0 +1,165 @@
+"""
+Parity tests for the ASGI variant of the Inventory API
+Runs the Flask endpoint tests from test_app.py against asgi_app.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from werkzeug.datastructures import Headers
+
+from asgi_app import app
+# Imported tests are collected here and use this module's client fixture
+from test_app import (reset_inventory, test_get_all_items, test_get_single_item,  # noqa: F401
+                      test_add_item, test_update_item, test_delete_item,
+                      test_head_and_options, test_request_body_errors,
+                      test_sqlite_store_routes)
+
+
+class ASGIResponse:
+    """Response with the attributes the Flask test client provides."""
+
+    def __init__(self, status_code, headers, data):
+        self.status_code = status_code
+        self.headers = headers
+        self.data = data
+
+
+def body_chunks(body, chunk_delay=0):
+    """Split a body into two receive() messages, optionally pausing between them."""
+    if not chunk_delay:
+        return [(body, 0)]
+    middle = len(body) // 2
+    return [(body[:middle], chunk_delay), (body[middle:], 0)]
+
+
+async def asgi_request(method, path, body=b'', headers=(), chunk_delay=0):
+    """Send one request through the ASGI app and collect the response."""
+    chunks = body_chunks(body, chunk_delay)
+    response = {}
+
+    async def receive():
+        if not chunks:
+            return {"type": "http.disconnect"}
+        chunk, delay = chunks.pop(0)
+        message = {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+        # Simulate a slow client: the rest of the body arrives later
+        await asyncio.sleep(delay)
+        return message
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            response['status'] = message['status']
+            response['headers'] = Headers([(k.decode(), v.decode()) for k, v in message['headers']])
+        else:
+            response['body'] = response.get('body', b'') + message.get('body', b'')
+
+    scope = {"type": "http", "method": method, "path": path,
+             "headers": [(k.lower().encode(), v.encode()) for k, v in headers]}
+    await app(scope, receive, send)
+    return ASGIResponse(response['status'], response['headers'], response['body'])
+
+
+def encode_json(value):
+    """Encode a request body; kept separate because open() takes a `json` argument."""
+    return json.dumps(value)
+
+
+class ASGITestClient:
+    """Minimal synchronous client with the Flask test client's call signatures."""
+
+    def open(self, path, method='GET', json=None, data=None, content_type=None, headers=None):
+        headers = list((headers or {}).items())
+        if json is not None:
+            data = encode_json(json)
+            content_type = 'application/json'
+        if content_type:
+            headers.append(('Content-Type', content_type))
+        body = data.encode() if isinstance(data, str) else (data or b'')
+        return asyncio.run(asgi_request(method, path, body, headers))
+
+    def get(self, path, **kwargs):
+        return self.open(path, method='GET', **kwargs)
+
+    def head(self, path, **kwargs):
+        return self.open(path, method='HEAD', **kwargs)
+
+    def options(self, path, **kwargs):
+        return self.open(path, method='OPTIONS', **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.open(path, method='POST', **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.open(path, method='PATCH', **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.open(path, method='DELETE', **kwargs)
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the ASGI app."""
+    return ASGITestClient()
+
+
+def test_missing_item_and_bad_method(client):
+    """Test 404 and 405 responses use the Flask status codes (bodies are JSON)."""
+    assert client.get('/inventory/999').status_code == 404
+    assert client.patch('/inventory/1', json={}).status_code == 400
+
+    response = client.delete('/inventory')
+    assert response.status_code == 405
+    assert set(response.headers['Allow'].split(', ')) == {'GET', 'HEAD', 'OPTIONS', 'POST'}
+
+
+def test_unexpected_error_returns_500(client):
+    """Test an exception inside a handler still produces a 500 response."""
+    response = client.post('/inventory', json=["product_name"])
+
+    assert response.status_code == 500
+    assert json.loads(response.data)['status'] == 0
+
+
+def test_concurrent_requests():
+    """Test many in-flight requests are served on one event loop."""
+    async def run():
+        return await asyncio.gather(*(asgi_request('GET', '/inventory') for _ in range(1000)))
+
+    responses = asyncio.run(run())
+
+    assert all(response.status_code == 200 for response in responses)
+    assert json.loads(responses[0].data)['items'][0]['id'] == 1
+
+
+def test_slow_clients_do_not_block():
+    """Test requests finish while many slow uploads are still in progress."""
+    slow_clients = 1000
+    body = json.dumps({"product_name": "Slow"}).encode()
+    headers = [('Content-Type', 'application/json')]
+
+    async def run():
+        uploads = [asyncio.create_task(asgi_request('POST', '/inventory', body, headers,
+                                                    chunk_delay=0.5))
+                   for _ in range(slow_clients)]
+        await asyncio.sleep(0.05)
+
+        # Every slow client is mid-upload, yet a fast request is answered right away
+        started = time.perf_counter()
+        fast = await asgi_request('GET', '/inventory/1')
+        fast_time = time.perf_counter() - started
+        assert not any(upload.done() for upload in uploads)
+
+        return fast, fast_time, await asyncio.gather(*uploads)
+
+    started = time.perf_counter()
+    fast, fast_time, uploads = asyncio.run(run())
+    total_time = time.perf_counter() - started
+
+    assert fast.status_code == 200
+    assert fast_time < 0.1
+    assert all(upload.status_code == 201 for upload in uploads)
+    # Served concurrently: about one delay in total, not one per client
+    assert total_time < 5